@@ -0,0 +1,18 @@
+"""
+EdTech Platform - ML Services Gunicorn Configuration
+Production server settings: gunicorn -c gunicorn_conf.py main:app
+"""
+
+import multiprocessing
+import os
+
+# Server socket
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# Worker processes (one event loop and database pool per worker)
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 5
+
+# Import the app and model modules once in the master; workers share the pages copy-on-write
+preload_app = True
@@ -5,12 +5,19 @@ FastAPI application for ML-powered features
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+import numpy as np
 import uvicorn
 import logging
+import os
+import functools
 from datetime import datetime
 import random
+import re
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,9 +27,13 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="EdTech Platform ML Services",
     description="ML-powered services for EdTech platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Compress large JSON payloads (long generated question lists)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +43,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Sentiment keyword patterns, compiled once so each request scans the text a single time per polarity
+POSITIVE_RE = re.compile(r"\b(?:good|great|excellent|amazing|wonderful|happy|love|like)\b")
+NEGATIVE_RE = re.compile(r"\b(?:bad|terrible|awful|hate|dislike|sad|angry|frustrated)\b")
+
+# Visual content labels by average feature value: <= 0.4, <= 0.7, above
+VISUAL_THRESHOLDS = np.array([0.4, 0.7])
+VISUAL_CONTENT_TYPES = ("text", "chart", "diagram")
+
 # Pydantic models
 class SentimentAnalysisRequest(BaseModel):
     text: str
@@ -56,7 +75,7 @@ class PaperGenerationResponse(BaseModel):
     processing_time_ms: float
 
 class VisualContentRequest(BaseModel):
-    image_features: List[float]
+    image_features: List[float] = Field(..., min_length=20, max_length=20)  # 20 features representing the image
     content_type: Optional[str] = None
 
 class VisualContentResponse(BaseModel):
@@ -64,6 +83,25 @@ class VisualContentResponse(BaseModel):
     confidence: float
     processing_time_ms: float
 
+@functools.lru_cache(maxsize=4096)
+def _question(subject: str, topic: str) -> str:
+    """Question text for a subject/topic pair"""
+    return f"Explain the concept of {topic} in {subject}."
+
+@functools.lru_cache(maxsize=10000)
+def _sentiment_score(text: str) -> Tuple[float, float, str]:
+    """Keyword-based (polarity, subjectivity, label) for a text"""
+    text_lower = text.lower()
+    
+    positive_count = len(POSITIVE_RE.findall(text_lower))
+    negative_count = len(NEGATIVE_RE.findall(text_lower))
+    
+    if positive_count > negative_count:
+        return 0.6, 0.5, "positive"
+    if negative_count > positive_count:
+        return -0.4, 0.5, "negative"
+    return 0.0, 0.5, "neutral"
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -86,104 +124,95 @@ async def health_check():
         "timestamp": datetime.now().isoformat()
     }
 
-@app.post("/api/v1/sentiment/analyze", response_model=SentimentAnalysisResponse)
+@app.get("/admin/cache/stats")
+async def cache_stats():
+    """Hit/miss counters of the in-process result caches"""
+    return {
+        "sentiment": _sentiment_score.cache_info()._asdict(),
+        "questions": _question.cache_info()._asdict()
+    }
+
+@app.post("/api/v1/sentiment/analyze", responses={200: {"model": SentimentAnalysisResponse}})
 async def analyze_sentiment(request: SentimentAnalysisRequest):
     """Analyze sentiment of text"""
-    start_time = datetime.now()
+    t0 = time.perf_counter_ns()
     
     try:
-        # Simple sentiment analysis based on keywords
-        text_lower = request.text.lower()
+        # Simple sentiment analysis based on keywords; repeated messages are served from the cache
+        polarity, subjectivity, label = _sentiment_score(request.text)
         
-        positive_words = ["good", "great", "excellent", "amazing", "wonderful", "happy", "love", "like"]
-        negative_words = ["bad", "terrible", "awful", "hate", "dislike", "sad", "angry", "frustrated"]
+        processing_time = (time.perf_counter_ns() - t0) / 1_000_000
         
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-        
-        if positive_count > negative_count:
-            polarity = 0.6
-            label = "positive"
-        elif negative_count > positive_count:
-            polarity = -0.4
-            label = "negative"
-        else:
-            polarity = 0.0
-            label = "neutral"
-        
-        subjectivity = 0.5
-        
-        processing_time = (datetime.now() - start_time).microseconds / 1000
-        
-        return SentimentAnalysisResponse(
-            polarity=polarity,
-            subjectivity=subjectivity,
-            label=label,
-            processing_time_ms=processing_time
-        )
+        # Plain dict: serialized by orjson without a response model pass
+        return {
+            "polarity": polarity,
+            "subjectivity": subjectivity,
+            "label": label,
+            "processing_time_ms": processing_time
+        }
         
     except Exception as e:
         logger.error(f"Error in sentiment analysis: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/v1/paper/generate", response_model=PaperGenerationResponse)
+@app.post("/api/v1/paper/generate", responses={200: {"model": PaperGenerationResponse}})
 async def generate_paper(request: PaperGenerationRequest):
     """Generate exam questions"""
-    start_time = datetime.now()
+    t0 = time.perf_counter_ns()
     
     try:
-        questions = []
-        for i in range(request.num_questions):
-            topic = random.choice(request.topics) if request.topics else "General"
-            question = f"Explain the concept of {topic} in {request.subject}."
-            questions.append(question)
+        topics = random.choices(request.topics, k=request.num_questions) if request.topics else ["General"] * request.num_questions
+        questions = [_question(request.subject, topic) for topic in topics]
         
-        processing_time = (datetime.now() - start_time).microseconds / 1000
+        processing_time = (time.perf_counter_ns() - t0) / 1_000_000
         
-        return PaperGenerationResponse(
-            subject=request.subject,
-            questions=questions,
-            difficulty_level=request.difficulty_level,
-            processing_time_ms=processing_time
-        )
+        # Plain dict: serialized by orjson without a response model pass
+        return {
+            "subject": request.subject,
+            "questions": questions,
+            "difficulty_level": request.difficulty_level,
+            "processing_time_ms": processing_time
+        }
         
     except Exception as e:
         logger.error(f"Error in paper generation: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/v1/visual/analyze", response_model=VisualContentResponse)
+@app.post("/api/v1/visual/analyze", responses={200: {"model": VisualContentResponse}})
 async def analyze_visual_content(request: VisualContentRequest):
     """Analyze visual learning content"""
-    start_time = datetime.now()
+    t0 = time.perf_counter_ns()
     
     try:
-        # Simple classification based on feature values
-        if len(request.image_features) != 20:
-            raise HTTPException(status_code=400, detail="Image features must have exactly 20 values")
-        
-        # Simple rule-based classification
-        avg_feature = sum(request.image_features) / len(request.image_features)
-        
-        if avg_feature > 0.7:
-            content_type = "diagram"
-        elif avg_feature > 0.4:
-            content_type = "chart"
-        else:
-            content_type = "text"
+        # Simple rule-based classification on the average feature value
+        avg_feature = np.mean(request.image_features)
+        content_type = VISUAL_CONTENT_TYPES[np.searchsorted(VISUAL_THRESHOLDS, avg_feature)]
         
         confidence = random.uniform(0.7, 0.95)
         
-        processing_time = (datetime.now() - start_time).microseconds / 1000
+        processing_time = (time.perf_counter_ns() - t0) / 1_000_000
         
-        return VisualContentResponse(
-            content_type=content_type,
-            confidence=confidence,
-            processing_time_ms=processing_time
-        )
+        # Plain dict: serialized by orjson without a response model pass
+        return {
+            "content_type": content_type,
+            "confidence": confidence,
+            "processing_time_ms": processing_time
+        }
         
     except Exception as e:
         logger.error(f"Error in visual content analysis: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Import string so uvicorn can spawn one worker process per CPU
+    # ("auto" picks uvloop/httptools where installed; uvloop is not available on Windows)
+    uvicorn.run(
+        "main_simple:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=os.cpu_count(),
+        log_level="warning",
+        access_log=False
+    )
@@ -0,0 +1,26 @@
+"""
+EdTech Platform - ML Services Background Worker
+arq worker for long-running jobs, run separately from the API: arq worker.WorkerSettings
+"""
+
+import asyncio
+import logging
+import os
+
+from arq.connections import RedisSettings
+from arq.worker import func
+
+logger = logging.getLogger(__name__)
+
+async def generate_data_task(ctx):
+    """Background task to generate dummy data"""
+    logger.info("Generating dummy data...")
+    # Simulate data generation
+    await asyncio.sleep(5)
+    logger.info("Dummy data generation completed")
+
+class WorkerSettings:
+    """arq worker configuration"""
+    # No stored result, so the fixed job ID is free again as soon as a run finishes
+    functions = [func(generate_data_task, keep_result=0)]
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379"))
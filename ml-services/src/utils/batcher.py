@@ -0,0 +1,91 @@
+"""
+EdTech Platform - Micro Batcher
+Groups concurrent single-sample model calls into batched calls
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List
+
+logger = logging.getLogger(__name__)
+
+class MicroBatcher:
+    """
+    Collects items submitted from request threads and runs them through
+    batch_fn together on a background thread
+    Items already queued are always taken; max_latency_ms additionally waits
+    for a batch to fill, trading per-request latency for larger batches
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], max_batch_size: int = 32,
+                 max_latency_ms: float = 0.0, name: str = "batcher"):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self.name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = None
+
+    def start(self):
+        """Start the background batching thread"""
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Flush queued items and stop the background thread"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, item: Any) -> Future:
+        """Queue an item for the next batch"""
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def _run(self):
+        """Drain the queue into batches until stopped"""
+        stopping = False
+        while not stopping:
+            entry = self._queue.get()
+            if entry is None:
+                return
+
+            batch = [entry]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                try:
+                    timeout = deadline - time.monotonic()
+                    entry = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            self._process(batch)
+
+    def _process(self, batch):
+        """Run one batch and resolve its futures"""
+        try:
+            results = self.batch_fn([item for item, _ in batch])
+        except Exception as e:
+            logger.error(f"Error in {self.name} batch of {len(batch)}: {str(e)}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        if len(results) != len(batch):
+            error = RuntimeError(f"{self.name} returned {len(results)} results for a batch of {len(batch)}")
+            logger.error(str(error))
+            for _, future in batch:
+                future.set_exception(error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
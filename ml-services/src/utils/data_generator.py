@@ -5,16 +5,84 @@ Generates realistic training data for ML models addressing Pain Points #1 and #5
 
 import pandas as pd
 import numpy as np
-import random
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from datetime import datetime
 import json
 import os
-from typing import Dict, List, Tuple
+from hashlib import blake2b
+from typing import Dict, List, Optional, Tuple
+
+# Realistic message content per message type
+MESSAGE_TEMPLATES_BY_TYPE = {
+    "attendance": [
+        "Your child was absent today. Please provide a reason.",
+        "Great attendance this week! Keep it up.",
+        "Please ensure regular attendance for better performance."
+    ],
+    "academic": [
+        "Your child's performance has improved significantly.",
+        "Please review the homework assigned today.",
+        "Exam schedule has been updated. Please check."
+    ],
+    "fee": [
+        "Fee payment is due. Please complete the payment.",
+        "Thank you for the timely fee payment.",
+        "Payment reminder: Please clear pending fees."
+    ],
+    "general": [
+        "Parent-teacher meeting scheduled for next week.",
+        "School event notification: Annual day celebration.",
+        "Important announcement: School will be closed tomorrow."
+    ]
+}
+
+# Sentiment distribution (positive, negative, neutral) per message type
+SENTIMENT_SCORES = {
+    "attendance": {"positive": 0.3, "negative": 0.4, "neutral": 0.3},
+    "academic": {"positive": 0.6, "negative": 0.2, "neutral": 0.2},
+    "fee": {"positive": 0.2, "negative": 0.5, "neutral": 0.3},
+    "general": {"positive": 0.4, "negative": 0.1, "neutral": 0.5}
+}
+
+# Flat lookup tables for drawing whole columns of messages at once
+MESSAGE_TYPES = np.array(list(MESSAGE_TEMPLATES_BY_TYPE))
+MESSAGE_TEMPLATES = np.array([template for templates in MESSAGE_TEMPLATES_BY_TYPE.values() for template in templates])
+TEMPLATE_COUNTS = np.array([len(templates) for templates in MESSAGE_TEMPLATES_BY_TYPE.values()])
+TEMPLATE_OFFSETS = np.concatenate(([0], np.cumsum(TEMPLATE_COUNTS)[:-1]))
+SENTIMENTS = np.array(["positive", "negative", "neutral"])
+SENTIMENT_CDF = np.cumsum([[SENTIMENT_SCORES[t][s] for s in SENTIMENTS] for t in MESSAGE_TYPES], axis=1)
+SENTIMENT_CDF[:, -1] = 1.0  # Guard against rounding so every draw lands in a bucket
+BOARDS = np.array(["CBSE", "ICSE", "State Board"])
+LOCATIONS = np.array(["Mumbai", "Delhi", "Bangalore", "Chennai", "Hyderabad"])
+ACCREDITATIONS = np.array(["A+", "A", "B+", "B"])
+LANGUAGES = np.array(["English", "Hindi", "Tamil", "Telugu", "Kannada"])
+PAYMENT_METHODS = np.array(["Online", "Cash", "Cheque", "UPI"])
+ROLES = np.array(["teacher", "student", "parent"])
+QUALIFICATIONS = np.array(["B.Ed", "M.Ed", "PhD"])
+SECTIONS = np.array(["A", "B", "C", "D"])
+
+# Low-cardinality text columns are built as pandas categoricals from integer codes
+def categorical(codes: np.ndarray, categories: np.ndarray) -> pd.Categorical:
+    """Categorical column from codes into categories (-1 marks a missing value)"""
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+# Tables produced by generate_all_data
+DATASETS = ("schools", "users", "attendance", "communication", "fees")
+
+def read_cached_frame(path: str) -> pd.DataFrame:
+    """Read a cached parquet frame with the datetime units it was written with"""
+    df = pd.read_parquet(path, engine="pyarrow", memory_map=True)
+    # Parquet has no second resolution, so datetime64[s] columns come back as ms
+    columns = pq.read_schema(path).pandas_metadata["columns"]
+    return df.astype({column["name"]: column["numpy_type"] for column in columns if column["pandas_type"] == "datetime"})
 
 class EdTechDataGenerator:
     """Generates dummy data for EdTech platform ML training"""
     
-    def __init__(self, num_schools: int = 5, num_students: int = 1000, num_teachers: int = 50):
+    def __init__(self, num_schools: int = 5, num_students: int = 1000, num_teachers: int = 50,
+                 seed: Optional[int] = None):
         self.num_schools = num_schools
         self.num_students = num_students
         self.num_teachers = num_teachers
@@ -43,273 +111,228 @@ class EdTechDataGenerator:
             "ICSE": {"monthly": 12000, "quarterly": 33000, "annual": 120000},
             "State Board": {"monthly": 5000, "quarterly": 14000, "annual": 50000}
         }
+        
+        # Random generator for all column draws; a fixed seed reproduces the same dataset
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
 
     def generate_schools_data(self) -> pd.DataFrame:
         """Generate school information"""
-        schools_data = []
-        for i in range(self.num_schools):
-            school = self.schools[i] if i < len(self.schools) else {
-                "name": f"School {i+1}",
-                "board": random.choice(["CBSE", "ICSE", "State Board"]),
-                "location": random.choice(["Mumbai", "Delhi", "Bangalore", "Chennai", "Hyderabad"])
-            }
-            
-            schools_data.append({
-                "school_id": i + 1,
-                "school_name": school["name"],
-                "board": school["board"],
-                "location": school["location"],
-                "total_students": random.randint(200, 800),
-                "total_teachers": random.randint(20, 60),
-                "established_year": random.randint(1990, 2010),
-                "accreditation": random.choice(["A+", "A", "B+", "B"]),
-                "fee_structure": self.fee_structures[school["board"]]
-            })
-        
-        return pd.DataFrame(schools_data)
+        # Known schools first; any extra schools get a generated name, board and location
+        known = self.schools[:self.num_schools]
+        num_extra = self.num_schools - len(known)
+        boards = np.concatenate([[school["board"] for school in known], BOARDS[self.rng.integers(0, len(BOARDS), size=num_extra)]])
+        
+        return pd.DataFrame({
+            "school_id": np.arange(1, self.num_schools + 1),
+            "school_name": [school["name"] for school in known] + [f"School {i+1}" for i in range(len(known), self.num_schools)],
+            "board": boards,
+            "location": np.concatenate([[school["location"] for school in known], LOCATIONS[self.rng.integers(0, len(LOCATIONS), size=num_extra)]]),
+            "total_students": self.rng.integers(200, 801, size=self.num_schools),
+            "total_teachers": self.rng.integers(20, 61, size=self.num_schools),
+            "established_year": self.rng.integers(1990, 2011, size=self.num_schools),
+            "accreditation": ACCREDITATIONS[self.rng.integers(0, len(ACCREDITATIONS), size=self.num_schools)],
+            "fee_structure": [self.fee_structures[board] for board in boards]
+        })
 
     def generate_users_data(self) -> pd.DataFrame:
         """Generate users (teachers, parents, students)"""
-        users_data = []
+        # Subjects of every board flattened, with each school's slice of them; schools without details follow CBSE
+        boards = list(self.subjects)
+        subjects, board_subjects = np.unique(
+            [subject for board in boards for subject in self.subjects[board]], return_inverse=True
+        )
+        board_sizes = np.array([len(self.subjects[board]) for board in boards])
+        board_offsets = np.cumsum(board_sizes) - board_sizes
+        school_board = np.full(self.num_schools, boards.index("CBSE"))
+        for i, school in enumerate(self.schools[:self.num_schools]):
+            school_board[i] = boards.index(school["board"])
         
         # Generate teachers
-        for i in range(self.num_teachers):
-            school_id = random.randint(1, self.num_schools)
-            school = self.schools[school_id - 1] if school_id <= len(self.schools) else {"board": "CBSE"}
-            subjects = self.subjects[school["board"]]
-            
-            users_data.append({
-                "user_id": i + 1,
-                "username": f"teacher{i+1}",
-                "email": f"teacher{i+1}@school{school_id}.edu",
-                "role": "teacher",
-                "school_id": school_id,
-                "subject": random.choice(subjects),
-                "experience_years": random.randint(1, 15),
-                "qualification": random.choice(["B.Ed", "M.Ed", "PhD"]),
-                "created_at": self.start_date - timedelta(days=random.randint(30, 365))
-            })
-        
-        # Generate students and parents
-        for i in range(self.num_students):
-            student_id = self.num_teachers + i + 1
-            parent_id = student_id + self.num_students
-            school_id = random.randint(1, self.num_schools)
-            school = self.schools[school_id - 1] if school_id <= len(self.schools) else {"board": "CBSE"}
-            
-            # Student
-            users_data.append({
-                "user_id": student_id,
-                "username": f"student{i+1}",
-                "email": f"student{i+1}@school{school_id}.edu",
-                "role": "student",
-                "school_id": school_id,
-                "class": random.randint(1, 12),
-                "section": random.choice(["A", "B", "C", "D"]),
-                "parent_id": parent_id,
-                "created_at": self.start_date - timedelta(days=random.randint(30, 365))
-            })
-            
-            # Parent
-            users_data.append({
-                "user_id": parent_id,
-                "username": f"parent{i+1}",
-                "email": f"parent{i+1}@email.com",
-                "role": "parent",
-                "school_id": school_id,
-                "phone": f"+91{random.randint(7000000000, 9999999999)}",
-                "preferred_language": random.choice(["English", "Hindi", "Tamil", "Telugu", "Kannada"]),
-                "created_at": self.start_date - timedelta(days=random.randint(30, 365))
-            })
-        
-        return pd.DataFrame(users_data)
+        teacher_number = np.arange(1, self.num_teachers + 1).astype(str)
+        teacher_school = self.rng.integers(1, self.num_schools + 1, size=self.num_teachers)
+        teacher_board = school_board[teacher_school - 1]
+        teachers = pd.DataFrame({
+            "user_id": np.arange(1, self.num_teachers + 1),
+            "username": np.char.add("teacher", teacher_number),
+            "email": self._school_emails("teacher", teacher_number, teacher_school),
+            "role": categorical(np.zeros(self.num_teachers, dtype=np.int8), ROLES),
+            "school_id": teacher_school,
+            "subject": categorical(
+                board_subjects[board_offsets[teacher_board] + self.rng.integers(0, board_sizes[teacher_board])], subjects
+            ),
+            "experience_years": self.rng.integers(1, 16, size=self.num_teachers),
+            "qualification": categorical(self.rng.integers(0, len(QUALIFICATIONS), size=self.num_teachers), QUALIFICATIONS),
+            "created_at": self._account_created_at(self.num_teachers)
+        })
+        
+        # Generate students and parents; each parent row follows its student's row
+        student_number = np.arange(1, self.num_students + 1).astype(str)
+        student_id = np.arange(self.num_teachers + 1, self.num_teachers + self.num_students + 1)
+        parent_id = student_id + self.num_students
+        student_school = self.rng.integers(1, self.num_schools + 1, size=self.num_students)
+        
+        students = pd.DataFrame({
+            "user_id": student_id,
+            "username": np.char.add("student", student_number),
+            "email": self._school_emails("student", student_number, student_school),
+            "role": categorical(np.ones(self.num_students, dtype=np.int8), ROLES),
+            "school_id": student_school,
+            "class": self.rng.integers(1, 13, size=self.num_students),
+            "section": categorical(self.rng.integers(0, len(SECTIONS), size=self.num_students), SECTIONS),
+            "parent_id": parent_id,
+            "created_at": self._account_created_at(self.num_students)
+        }, index=np.arange(0, 2 * self.num_students, 2))
+        
+        parents = pd.DataFrame({
+            "user_id": parent_id,
+            "username": np.char.add("parent", student_number),
+            "email": np.char.add(np.char.add("parent", student_number), "@email.com"),
+            "role": categorical(np.full(self.num_students, 2, dtype=np.int8), ROLES),
+            "school_id": student_school,
+            "phone": np.char.add("+91", self.rng.integers(7000000000, 9999999999, size=self.num_students, endpoint=True).astype(str)),
+            "preferred_language": categorical(self.rng.integers(0, len(LANGUAGES), size=self.num_students), LANGUAGES),
+            "created_at": self._account_created_at(self.num_students)
+        }, index=np.arange(1, 2 * self.num_students, 2))
+        
+        families = pd.concat([students, parents]).sort_index()
+        return pd.concat([teachers, families], ignore_index=True)
+
+    @staticmethod
+    def _school_emails(role: str, numbers: np.ndarray, school_ids: np.ndarray) -> np.ndarray:
+        """Build {role}{n}@school{id}.edu addresses"""
+        local_part = np.char.add(np.char.add(role, numbers), "@school")
+        return np.char.add(np.char.add(local_part, school_ids.astype(str)), ".edu")
+
+    def _account_created_at(self, size: int) -> np.ndarray:
+        """Account creation dates 30 to 365 days before the data window"""
+        return np.datetime64(self.start_date, "D") - self.rng.integers(30, 366, size=size).astype("timedelta64[D]")
 
     def generate_attendance_data(self) -> pd.DataFrame:
         """Generate attendance data for Pain Point #1"""
-        attendance_data = []
-        current_date = self.start_date
-        
-        while current_date <= self.end_date:
-            # Skip weekends
-            if current_date.weekday() < 5:  # Monday to Friday
-                for student_id in range(self.num_teachers + 1, self.num_teachers + self.num_students + 1):
-                    # Generate realistic attendance patterns
-                    base_attendance_rate = 0.92  # 92% base attendance
-                    
-                    # Add seasonal variations (lower attendance in monsoon, higher in winter)
-                    if current_date.month in [6, 7, 8]:  # Monsoon
-                        base_attendance_rate -= 0.05
-                    elif current_date.month in [12, 1, 2]:  # Winter
-                        base_attendance_rate += 0.02
-                    
-                    # Add weekly patterns (lower on Mondays, higher on Fridays)
-                    if current_date.weekday() == 0:  # Monday
-                        base_attendance_rate -= 0.03
-                    elif current_date.weekday() == 4:  # Friday
-                        base_attendance_rate += 0.02
-                    
-                    # Individual student variations
-                    student_variation = random.uniform(-0.1, 0.1)
-                    final_attendance_rate = max(0.7, min(0.98, base_attendance_rate + student_variation))
-                    
-                    is_present = random.random() < final_attendance_rate
-                    
-                    if is_present:
-                        # Generate QR scan time (between 8:00 AM and 9:30 AM)
-                        scan_hour = 8
-                        scan_minute = random.randint(0, 90)
-                        if scan_minute >= 60:
-                            scan_hour += 1
-                            scan_minute -= 60
-                        scan_time = current_date.replace(hour=scan_hour, minute=scan_minute)
-                    else:
-                        scan_time = None
-                    
-                    attendance_data.append({
-                        "attendance_id": len(attendance_data) + 1,
-                        "student_id": student_id,
-                        "date": current_date.date(),
-                        "is_present": is_present,
-                        "scan_time": scan_time,
-                        "qr_code": f"QR_{current_date.strftime('%Y%m%d')}_{student_id}",
-                        "created_at": current_date
-                    })
-            
-            current_date += timedelta(days=1)
+        # One row per school day (Monday to Friday) and student, drawn as (days, students) matrices
+        dates = pd.bdate_range(self.start_date, self.end_date)
+        student_ids = np.arange(self.num_teachers + 1, self.num_teachers + self.num_students + 1)
+        num_days, num_students = len(dates), len(student_ids)
+        
+        # Add seasonal variations (lower attendance in monsoon, higher in winter)
+        month = dates.month.to_numpy()
+        seasonal_adjustment = np.select([np.isin(month, [6, 7, 8]), np.isin(month, [12, 1, 2])], [-0.05, 0.02], 0.0)
+        
+        # Add weekly patterns (lower on Mondays, higher on Fridays)
+        weekday = dates.weekday.to_numpy()
+        weekly_adjustment = np.select([weekday == 0, weekday == 4], [-0.03, 0.02], 0.0)
         
-        return pd.DataFrame(attendance_data)
+        # 92% base attendance plus individual student variations
+        attendance_rates = np.clip(
+            0.92 + (seasonal_adjustment + weekly_adjustment)[:, None]
+            + self.rng.uniform(-0.1, 0.1, size=(num_days, num_students)),
+            0.7, 0.98
+        )
+        is_present = (self.rng.random((num_days, num_students)) < attendance_rates).ravel()
+        
+        # Generate QR scan times between 8:00 AM and 9:30 AM for present students
+        day_index = np.repeat(np.arange(num_days), num_students)
+        day_start = dates.to_numpy()[day_index]
+        scan_minutes = self.rng.integers(8 * 60, 8 * 60 + 91, size=day_index.size).astype("timedelta64[m]")
+        scan_time = np.where(is_present, day_start + scan_minutes, np.datetime64("NaT"))
+        
+        qr_prefix = np.asarray("QR_" + dates.strftime("%Y%m%d") + "_", dtype=str)
+        qr_code = np.char.add(qr_prefix[:, None], student_ids.astype(str)[None, :]).ravel()
+        
+        return pd.DataFrame({
+            "attendance_id": np.arange(1, day_index.size + 1),
+            "student_id": np.tile(student_ids, num_days),
+            "date": dates.date[day_index],
+            "is_present": is_present,
+            "scan_time": scan_time,
+            "qr_code": qr_code,
+            "created_at": day_start
+        })
 
     def generate_communication_data(self) -> pd.DataFrame:
         """Generate communication data for Pain Point #5"""
-        communication_data = []
+        # Generate 5-15 messages per day over the last 6 months
+        messages_per_day = self.rng.integers(5, 16, size=180)
+        day = np.repeat(np.arange(messages_per_day.size), messages_per_day)
+        num_messages = day.size
+        num_users = self.num_teachers + self.num_students
         
-        # Generate messages over the last 6 months
-        for day in range(180):
-            current_date = self.end_date - timedelta(days=day)
-            
-            # Generate 5-15 messages per day
-            num_messages = random.randint(5, 15)
-            
-            for _ in range(num_messages):
-                sender_id = random.randint(1, self.num_teachers + self.num_students)
-                sender_role = "teacher" if sender_id <= self.num_teachers else "parent"
-                
-                if sender_role == "teacher":
-                    receiver_id = random.randint(self.num_teachers + 1, self.num_teachers + self.num_students)
-                    receiver_role = "parent"
-                else:
-                    receiver_id = random.randint(1, self.num_teachers)
-                    receiver_role = "teacher"
-                
-                # Generate realistic message content
-                message_templates = {
-                    "attendance": [
-                        "Your child was absent today. Please provide a reason.",
-                        "Great attendance this week! Keep it up.",
-                        "Please ensure regular attendance for better performance."
-                    ],
-                    "academic": [
-                        "Your child's performance has improved significantly.",
-                        "Please review the homework assigned today.",
-                        "Exam schedule has been updated. Please check."
-                    ],
-                    "fee": [
-                        "Fee payment is due. Please complete the payment.",
-                        "Thank you for the timely fee payment.",
-                        "Payment reminder: Please clear pending fees."
-                    ],
-                    "general": [
-                        "Parent-teacher meeting scheduled for next week.",
-                        "School event notification: Annual day celebration.",
-                        "Important announcement: School will be closed tomorrow."
-                    ]
-                }
-                
-                message_type = random.choice(list(message_templates.keys()))
-                message_content = random.choice(message_templates[message_type])
-                
-                # Add language variations
-                languages = ["English", "Hindi", "Tamil", "Telugu", "Kannada"]
-                language = random.choice(languages)
-                
-                # Generate sentiment (positive, negative, neutral)
-                sentiment_scores = {
-                    "attendance": {"positive": 0.3, "negative": 0.4, "neutral": 0.3},
-                    "academic": {"positive": 0.6, "negative": 0.2, "neutral": 0.2},
-                    "fee": {"positive": 0.2, "negative": 0.5, "neutral": 0.3},
-                    "general": {"positive": 0.4, "negative": 0.1, "neutral": 0.5}
-                }
-                
-                sentiment = np.random.choice(
-                    ["positive", "negative", "neutral"],
-                    p=[sentiment_scores[message_type]["positive"], 
-                       sentiment_scores[message_type]["negative"], 
-                       sentiment_scores[message_type]["neutral"]]
-                )
-                
-                communication_data.append({
-                    "message_id": len(communication_data) + 1,
-                    "sender_id": sender_id,
-                    "receiver_id": receiver_id,
-                    "message_type": message_type,
-                    "content": message_content,
-                    "language": language,
-                    "sentiment": sentiment,
-                    "is_read": random.choice([True, False]),
-                    "response_time_minutes": random.randint(5, 1440) if random.random() < 0.8 else None,
-                    "created_at": current_date - timedelta(hours=random.randint(0, 23))
-                })
-        
-        return pd.DataFrame(communication_data)
+        # Teachers write to parents, parents write to teachers
+        sender_id = self.rng.integers(1, num_users + 1, size=num_messages)
+        receiver_id = np.where(
+            sender_id <= self.num_teachers,
+            self.rng.integers(self.num_teachers + 1, num_users + 1, size=num_messages),
+            self.rng.integers(1, self.num_teachers + 1, size=num_messages)
+        )
+        
+        # Pick a message type, then one of its templates and a sentiment from its distribution
+        type_index = self.rng.integers(0, len(MESSAGE_TYPES), size=num_messages)
+        template_index = TEMPLATE_OFFSETS[type_index] + self.rng.integers(0, TEMPLATE_COUNTS[type_index])
+        sentiment_index = (self.rng.random((num_messages, 1)) < SENTIMENT_CDF[type_index]).argmax(axis=1)
+        
+        responded = self.rng.random(num_messages) < 0.8
+        response_time = np.where(responded, self.rng.integers(5, 1441, size=num_messages), np.nan)
+        
+        created_at = (
+            np.datetime64(self.end_date, "h")
+            - day.astype("timedelta64[D]")
+            - self.rng.integers(0, 24, size=num_messages).astype("timedelta64[h]")
+        )
+        
+        return pd.DataFrame({
+            "message_id": np.arange(1, num_messages + 1),
+            "sender_id": sender_id,
+            "receiver_id": receiver_id,
+            "message_type": categorical(type_index, MESSAGE_TYPES),
+            "content": MESSAGE_TEMPLATES[template_index],
+            "language": categorical(self.rng.integers(0, len(LANGUAGES), size=num_messages), LANGUAGES),
+            "sentiment": categorical(sentiment_index, SENTIMENTS),
+            "is_read": self.rng.random(num_messages) < 0.5,
+            "response_time_minutes": response_time,
+            "created_at": created_at
+        })
 
     def generate_fee_data(self) -> pd.DataFrame:
         """Generate fee payment data"""
-        fee_data = []
+        # Fee records for the last 6 months per student, student by student
+        student_ids = np.arange(self.num_teachers + 1, self.num_teachers + self.num_students + 1)
+        num_months = 6
+        num_records = student_ids.size * num_months
         
-        for student_id in range(self.num_teachers + 1, self.num_teachers + self.num_students + 1):
-            # Get student's school
-            student_school = random.randint(1, self.num_schools)
-            school = self.schools[student_school - 1] if student_school <= len(self.schools) else {"board": "CBSE"}
-            fee_structure = self.fee_structures[school["board"]]
-            
-            # Generate fee records for the last 6 months
-            for month in range(6):
-                due_date = self.start_date + timedelta(days=month * 30)
-                amount = fee_structure["monthly"]
-                
-                # Payment behavior patterns
-                payment_probability = 0.85  # 85% payment rate
-                
-                # Add seasonal variations
-                if month in [5, 6]:  # Summer vacation
-                    payment_probability -= 0.1
-                
-                is_paid = random.random() < payment_probability
-                
-                if is_paid:
-                    payment_date = due_date + timedelta(days=random.randint(-5, 15))
-                    payment_method = random.choice(["Online", "Cash", "Cheque", "UPI"])
-                    late_fee = max(0, (payment_date - due_date).days * 50) if payment_date > due_date else 0
-                else:
-                    payment_date = None
-                    payment_method = None
-                    late_fee = 0
-                
-                fee_data.append({
-                    "fee_id": len(fee_data) + 1,
-                    "student_id": student_id,
-                    "month": due_date.month,
-                    "year": due_date.year,
-                    "amount": amount,
-                    "due_date": due_date.date(),
-                    "is_paid": is_paid,
-                    "payment_date": payment_date.date() if payment_date else None,
-                    "payment_method": payment_method,
-                    "late_fee": late_fee,
-                    "created_at": due_date
-                })
-        
-        return pd.DataFrame(fee_data)
+        # Get each student's school; schools without details fall back to CBSE fees
+        monthly_fees = np.full(self.num_schools, self.fee_structures["CBSE"]["monthly"])
+        for i, school in enumerate(self.schools[:self.num_schools]):
+            monthly_fees[i] = self.fee_structures[school["board"]]["monthly"]
+        student_school = self.rng.integers(0, self.num_schools, size=student_ids.size)
+        
+        # Due dates are shared by all students: build the 6 once and tile them
+        month_index = np.tile(np.arange(num_months), student_ids.size)
+        due_dates = pd.DatetimeIndex(np.datetime64(self.start_date, "D") + np.arange(num_months) * np.timedelta64(30, "D"))
+        due_date = due_dates.to_numpy()[month_index]
+        
+        # Payment behavior patterns: 85% payment rate, lower over summer vacation
+        payment_probability = np.where(np.isin(month_index, [5, 6]), 0.75, 0.85)
+        is_paid = self.rng.random(num_records) < payment_probability
+        
+        payment_offset = self.rng.integers(-5, 16, size=num_records)
+        payment_date = (due_date + payment_offset.astype("timedelta64[D]")).astype("datetime64[D]")
+        payment_method = self.rng.integers(0, len(PAYMENT_METHODS), size=num_records)
+        late_fee = np.where(is_paid & (payment_offset > 0), payment_offset * 50, 0)
+        
+        return pd.DataFrame({
+            "fee_id": np.arange(1, num_records + 1),
+            "student_id": np.repeat(student_ids, num_months),
+            "month": due_dates.month[month_index],
+            "year": due_dates.year[month_index],
+            "amount": np.repeat(monthly_fees[student_school], num_months),
+            "due_date": due_dates.date[month_index],
+            "is_paid": is_paid,
+            "payment_date": np.where(is_paid, payment_date.astype(object), None),
+            "payment_method": categorical(np.where(is_paid, payment_method, -1), PAYMENT_METHODS),
+            "late_fee": late_fee,
+            "created_at": due_date
+        })
 
     def generate_all_data(self) -> Dict[str, pd.DataFrame]:
         """Generate all dummy data"""
@@ -329,14 +352,51 @@ class EdTechDataGenerator:
         
         return data
 
+    def load_or_generate_data(self, cache_dir: str = "ml-services/data/cache") -> Dict[str, pd.DataFrame]:
+        """Load a seeded dataset from its parquet cache, generating and caching it on a miss"""
+        # Unseeded runs are meant to produce fresh data every time
+        if self.seed is None:
+            return self.generate_all_data()
+        
+        dataset_dir = os.path.join(cache_dir, self._cache_key())
+        paths = {key: os.path.join(dataset_dir, f"{key}.parquet") for key in DATASETS}
+        if all(os.path.exists(path) for path in paths.values()):
+            print(f"Loading cached data from {dataset_dir}")
+            return {key: read_cached_frame(path) for key, path in paths.items()}
+        
+        # Start from the seed so the cached data matches the key even if this instance already drew data
+        self.rng = np.random.default_rng(self.seed)
+        data = self.generate_all_data()
+        os.makedirs(dataset_dir, exist_ok=True)
+        for key, df in data.items():
+            # Write then rename so an interrupted run never leaves a partial cache file
+            tmp_path = f"{paths[key]}.tmp"
+            df.to_parquet(tmp_path, engine="pyarrow", index=False)
+            os.replace(tmp_path, paths[key])
+        
+        return data
+
+    def _cache_key(self) -> str:
+        """Hash of the generator settings and this module's code"""
+        config = json.dumps([self.num_schools, self.num_students, self.num_teachers, self.seed]).encode()
+        with open(__file__, "rb") as f:
+            code = f.read()
+        return blake2b(config + code, digest_size=8).hexdigest()
+
     def save_data(self, data: Dict[str, pd.DataFrame], output_dir: str = "ml-services/data"):
         """Save generated data to files"""
         os.makedirs(output_dir, exist_ok=True)
         
         for key, df in data.items():
-            # Save as CSV
+            # Save as CSV with Arrow's C++ writer: quoted strings, lowercase true/false, and
+            # timestamps always printed with their time of day (plus fraction for ms/us columns)
             csv_path = os.path.join(output_dir, f"{key}.csv")
-            df.to_csv(csv_path, index=False)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            for position, field in enumerate(table.schema):
+                # The CSV writer has no nested types, so nested columns (e.g. fee_structure) are written as JSON text
+                if pa.types.is_nested(field.type):
+                    table = table.set_column(position, field.name, pa.array(df[field.name].map(json.dumps), pa.string()))
+            pacsv.write_csv(table, csv_path)
             
             # Save as JSON for API testing
             json_path = os.path.join(output_dir, f"{key}.json")
@@ -349,11 +409,12 @@ def main():
     generator = EdTechDataGenerator(
         num_schools=5,
         num_students=1000,
-        num_teachers=50
+        num_teachers=50,
+        seed=42
     )
     
-    # Generate all data
-    data = generator.generate_all_data()
+    # Generate all data, reusing the cached copy when settings and code are unchanged
+    data = generator.load_or_generate_data()
     
     # Save data
     generator.save_data(data)
@@ -1,7 +1,48 @@
+"""
+EdTech Platform - Database Connection Pool
+Shared asyncpg connection pool
+"""
+
+import os
+from typing import Optional
+
+import asyncpg
+
 class DatabaseConnection:
-    def __init__(self):
-        # Stub: In production, initialize your DB connection here
-        self.connected = True
+    """Shared asyncpg connection pool, opened once at startup and reused by every request"""
+
+    def __init__(self, dsn: str, min_size: int = 5, max_size: Optional[int] = None,
+                 command_timeout: float = 30):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size or (os.cpu_count() or 1) * 4
+        self.command_timeout = command_timeout
+        self.pool: Optional[asyncpg.Pool] = None
+
+    async def connect(self):
+        """Open the pool; min_size connections are established and warmed up front"""
+        self.pool = await asyncpg.create_pool(
+            self.dsn,
+            min_size=self.min_size,
+            max_size=max(self.max_size, self.min_size),
+            command_timeout=self.command_timeout,
+            init=_init_connection
+        )
+
+    async def close(self):
+        """Close all pooled connections"""
+        if self.pool is not None:
+            await self.pool.close()
+
+    def is_connected(self) -> bool:
+        return self.pool is not None and not self.pool.is_closing()
+
+    def acquire(self, timeout: float = 2.0):
+        """Borrow a pooled connection: async with db_connection.acquire() as conn"""
+        if self.pool is None:
+            raise RuntimeError("Database connection pool is not open")
+        return self.pool.acquire(timeout=timeout)
 
-    def is_connected(self):
-        return self.connected 
\ No newline at end of file
+async def _init_connection(conn: asyncpg.Connection):
+    """Warm up each new pooled connection"""
+    await conn.execute("SELECT 1")
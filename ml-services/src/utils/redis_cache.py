@@ -0,0 +1,53 @@
+"""
+EdTech Platform - Redis Result Cache
+Memoizes model results shared across API workers
+"""
+
+import logging
+from hashlib import blake2b
+from typing import Any, Callable
+
+import orjson
+import redis
+
+logger = logging.getLogger(__name__)
+
+class RedisResultCache:
+    """
+    Redis-backed memoization of pure model calls
+    Results are stored as JSON under a hash of the call's input payload;
+    Redis errors fall back to running the model
+    """
+
+    def __init__(self, url: str, ttl: int = 3600, max_connections: int = 50):
+        self.client = redis.Redis(
+            connection_pool=redis.BlockingConnectionPool.from_url(url, max_connections=max_connections)
+        )
+        self.ttl = ttl
+
+    def get_or_compute(self, namespace: str, payload: bytes, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for payload, or compute and cache a new one"""
+        key = f"{namespace}:{blake2b(payload, digest_size=16).hexdigest()}"
+
+        try:
+            cached_value = self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache read failed: {str(e)}")
+            return compute()
+
+        if cached_value is not None:
+            return orjson.loads(cached_value)
+
+        result = compute()
+
+        try:
+            self.client.setex(key, self.ttl, orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))
+        except (redis.RedisError, TypeError) as e:
+            logger.warning(f"Redis cache write failed: {str(e)}")
+
+        return result
+
+    def close(self):
+        """Release pooled Redis connections"""
+        self.client.close()
+        self.client.connection_pool.disconnect()
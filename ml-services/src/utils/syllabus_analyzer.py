@@ -5,356 +5,108 @@ Intelligent syllabus selection and analysis for paper generation
 
 import json
 import os
-from typing import Dict, List, Optional, Any
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Any, Tuple
 from datetime import datetime
 import logging
 
+import numpy as np
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Syllabus, difficulty mapping and question bank JSON files
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Question types a unit allows when its syllabus does not list them
+QUESTION_TYPES_ALL = ("mcq", "short_answer", "long_answer")
+
+def _load_json(filename: str) -> Any:
+    """Parse a JSON file from DATA_DIR"""
+    with open(os.path.join(DATA_DIR, filename), "rb") as f:
+        return orjson.loads(f.read())
+
+def _freeze(value: Any, shared: Dict[tuple, tuple]) -> Any:
+    """Read-only copy of parsed JSON: dicts become mapping proxies, lists become tuples shared via `shared`"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item, shared) for key, item in value.items()})
+    if isinstance(value, list):
+        frozen = tuple(_freeze(item, shared) for item in value)
+        try:
+            return shared.setdefault(frozen, frozen)
+        except TypeError:
+            # Tuples of mappings are unhashable; they are never duplicated anyway
+            return frozen
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Plain, caller-owned copy of frozen data: mapping proxies become dicts, tuples become lists"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
 class SyllabusAnalyzer:
     """
     Intelligent syllabus analyzer for paper generation
     Handles board-specific syllabus, topic selection, and difficulty mapping
     """
     
-    def __init__(self):
-        self.syllabus_data = self._load_syllabus_data()
-        self.topic_difficulty_mapping = self._load_difficulty_mapping()
-        self.question_bank = self._load_question_bank()
+    # No per-instance state: the reference data lives on the class
+    __slots__ = ()
     
-    def _load_syllabus_data(self) -> Dict[str, Any]:
-        """Load comprehensive syllabus data for different boards"""
-        return {
-            "CBSE": {
-                "class_10": {
-                    "Mathematics": {
-                        "units": [
-                            {
-                                "name": "Real Numbers",
-                                "topics": ["Euclid's Division Lemma", "Fundamental Theorem of Arithmetic", "Irrational Numbers"],
-                                "weightage": 6,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Polynomials",
-                                "topics": ["Zeroes of Polynomial", "Relationship between Zeroes and Coefficients", "Division Algorithm"],
-                                "weightage": 4,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Pair of Linear Equations",
-                                "topics": ["Graphical Method", "Algebraic Methods", "Cross Multiplication Method"],
-                                "weightage": 6,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Quadratic Equations",
-                                "topics": ["Solution by Factorization", "Solution by Completing Square", "Quadratic Formula"],
-                                "weightage": 6,
-                                "difficulty": "hard",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Arithmetic Progressions",
-                                "topics": ["General Term", "Sum of n Terms", "Applications"],
-                                "weightage": 4,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Triangles",
-                                "topics": ["Similarity of Triangles", "Pythagoras Theorem", "Basic Proportionality Theorem"],
-                                "weightage": 6,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Coordinate Geometry",
-                                "topics": ["Distance Formula", "Section Formula", "Area of Triangle"],
-                                "weightage": 4,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Trigonometry",
-                                "topics": ["Trigonometric Ratios", "Trigonometric Identities", "Applications"],
-                                "weightage": 5,
-                                "difficulty": "hard",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Applications of Trigonometry",
-                                "topics": ["Heights and Distances", "Real-life Applications"],
-                                "weightage": 4,
-                                "difficulty": "hard",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Circles",
-                                "topics": ["Tangent to Circle", "Number of Tangents", "Properties of Tangents"],
-                                "weightage": 4,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Constructions",
-                                "topics": ["Division of Line Segment", "Construction of Tangents"],
-                                "weightage": 3,
-                                "difficulty": "medium",
-                                "question_types": ["long_answer"]
-                            },
-                            {
-                                "name": "Areas Related to Circles",
-                                "topics": ["Area of Sector", "Area of Segment", "Areas of Combinations"],
-                                "weightage": 3,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Surface Areas and Volumes",
-                                "topics": ["Surface Area", "Volume", "Combinations of Solids"],
-                                "weightage": 4,
-                                "difficulty": "medium",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Statistics",
-                                "topics": ["Mean", "Median", "Mode", "Cumulative Frequency"],
-                                "weightage": 4,
-                                "difficulty": "easy",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            },
-                            {
-                                "name": "Probability",
-                                "topics": ["Theoretical Probability", "Experimental Probability"],
-                                "weightage": 3,
-                                "difficulty": "easy",
-                                "question_types": ["mcq", "short_answer", "long_answer"]
-                            }
-                        ],
-                        "total_marks": 80,
-                        "duration": "3 hours",
-                        "paper_pattern": {
-                            "section_a": {"type": "mcq", "questions": 20, "marks_per_question": 1},
-                            "section_b": {"type": "short_answer", "questions": 6, "marks_per_question": 2},
-                            "section_c": {"type": "short_answer", "questions": 8, "marks_per_question": 3},
-                            "section_d": {"type": "long_answer", "questions": 6, "marks_per_question": 4}
-                        }
-                    },
-                    "Science": {
-                        "units": [
-                            {
-                                "name": "Chemical Reactions and Equations",
-                                "topics": ["Chemical Changes", "Balancing Equations", "Types of Reactions"],
-                                "weightage": 5,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Acids, Bases and Salts",
-                                "topics": ["pH Scale", "Neutralization", "Salts"],
-                                "weightage": 5,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Metals and Non-metals",
-                                "topics": ["Physical Properties", "Chemical Properties", "Reactivity Series"],
-                                "weightage": 5,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Carbon and its Compounds",
-                                "topics": ["Covalent Bonding", "Hydrocarbons", "Functional Groups"],
-                                "weightage": 4,
-                                "difficulty": "hard"
-                            },
-                            {
-                                "name": "Life Processes",
-                                "topics": ["Nutrition", "Respiration", "Transportation", "Excretion"],
-                                "weightage": 6,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Control and Coordination",
-                                "topics": ["Nervous System", "Endocrine System", "Plant Hormones"],
-                                "weightage": 4,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "How do Organisms Reproduce",
-                                "topics": ["Asexual Reproduction", "Sexual Reproduction", "Reproductive Health"],
-                                "weightage": 4,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Heredity and Evolution",
-                                "topics": ["Inheritance", "Variation", "Evolution"],
-                                "weightage": 4,
-                                "difficulty": "hard"
-                            },
-                            {
-                                "name": "Light - Reflection and Refraction",
-                                "topics": ["Reflection", "Refraction", "Lenses", "Mirrors"],
-                                "weightage": 5,
-                                "difficulty": "hard"
-                            },
-                            {
-                                "name": "Human Eye and Colourful World",
-                                "topics": ["Eye Structure", "Defects", "Dispersion", "Scattering"],
-                                "weightage": 3,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Electricity",
-                                "topics": ["Ohm's Law", "Resistance", "Series and Parallel Circuits"],
-                                "weightage": 5,
-                                "difficulty": "hard"
-                            },
-                            {
-                                "name": "Magnetic Effects of Electric Current",
-                                "topics": ["Magnetic Field", "Electromagnetic Induction", "Electric Motor"],
-                                "weightage": 4,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Sources of Energy",
-                                "topics": ["Conventional Sources", "Non-conventional Sources", "Environmental Impact"],
-                                "weightage": 3,
-                                "difficulty": "easy"
-                            },
-                            {
-                                "name": "Our Environment",
-                                "topics": ["Ecosystem", "Food Chains", "Environmental Problems"],
-                                "weightage": 3,
-                                "difficulty": "easy"
-                            },
-                            {
-                                "name": "Management of Natural Resources",
-                                "topics": ["Conservation", "Sustainable Development", "Local Management"],
-                                "weightage": 3,
-                                "difficulty": "easy"
-                            }
-                        ],
-                        "total_marks": 80,
-                        "duration": "3 hours"
-                    }
-                }
-            },
-            "ICSE": {
-                "class_10": {
-                    "Mathematics": {
-                        "units": [
-                            {
-                                "name": "Commercial Mathematics",
-                                "topics": ["Compound Interest", "Shares and Dividends", "Banking"],
-                                "weightage": 15,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Algebra",
-                                "topics": ["Linear Inequations", "Quadratic Equations", "Ratio and Proportion"],
-                                "weightage": 25,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Geometry",
-                                "topics": ["Similarity", "Loci", "Circles"],
-                                "weightage": 20,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Mensuration",
-                                "topics": ["Area and Volume", "Surface Area", "Combinations"],
-                                "weightage": 15,
-                                "difficulty": "medium"
-                            },
-                            {
-                                "name": "Trigonometry",
-                                "topics": ["Trigonometric Ratios", "Heights and Distances"],
-                                "weightage": 15,
-                                "difficulty": "hard"
-                            },
-                            {
-                                "name": "Statistics",
-                                "topics": ["Mean", "Median", "Mode", "Histograms"],
-                                "weightage": 10,
-                                "difficulty": "easy"
-                            }
-                        ],
-                        "total_marks": 80,
-                        "duration": "2.5 hours"
-                    }
-                }
-            }
-        }
+    # Reference data shared by every instance, parsed from DATA_DIR on first use
+    _SYLLABUS: Optional[Mapping[str, Any]] = None
+    _DIFFICULTY: Optional[Mapping[str, Mapping[str, Any]]] = None
+    _QUESTION_BANK: Optional[Mapping[str, Any]] = None
+    _load_lock = threading.Lock()
     
-    def _load_difficulty_mapping(self) -> Dict[str, Dict[str, Any]]:
-        """Load difficulty mapping for topics and question types"""
-        return {
-            "easy": {
-                "description": "Basic understanding required",
-                "time_per_question": {"mcq": 1, "short_answer": 3, "long_answer": 8},
-                "marks_range": {"mcq": 1, "short_answer": 2, "long_answer": 4},
-                "cognitive_level": "Remembering, Understanding"
-            },
-            "medium": {
-                "description": "Application and analysis required",
-                "time_per_question": {"mcq": 2, "short_answer": 5, "long_answer": 12},
-                "marks_range": {"mcq": 1, "short_answer": 3, "long_answer": 6},
-                "cognitive_level": "Applying, Analyzing"
-            },
-            "hard": {
-                "description": "Synthesis and evaluation required",
-                "time_per_question": {"mcq": 3, "short_answer": 8, "long_answer": 20},
-                "marks_range": {"mcq": 1, "short_answer": 4, "long_answer": 8},
-                "cognitive_level": "Evaluating, Creating"
-            }
-        }
+    @classmethod
+    def _ensure_loaded(cls):
+        """Load syllabus, difficulty mapping and question bank once per process"""
+        if cls._SYLLABUS is not None:
+            return
+        
+        with cls._load_lock:
+            if cls._SYLLABUS is None:
+                # Frozen so cached results can share them; equal lists (e.g. question types) become one tuple
+                shared = {QUESTION_TYPES_ALL: QUESTION_TYPES_ALL}
+                cls._DIFFICULTY = _freeze(_load_json("difficulty.json"), shared)
+                cls._QUESTION_BANK = _freeze(_load_json("question_bank.json"), shared)
+                # Set last: a non-None syllabus means everything is loaded
+                cls._SYLLABUS = _freeze(_load_json("syllabus.json"), shared)
     
-    def _load_question_bank(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Load question bank templates for different topics"""
-        return {
-            "Mathematics": {
-                "Real Numbers": [
-                    {
-                        "question": "Prove that √2 is irrational.",
-                        "type": "long_answer",
-                        "difficulty": "hard",
-                        "marks": 4,
-                        "solution": "Using contradiction method...",
-                        "topics": ["Irrational Numbers", "Proof by Contradiction"]
-                    },
-                    {
-                        "question": "Find the HCF of 96 and 404 by prime factorization method.",
-                        "type": "short_answer",
-                        "difficulty": "medium",
-                        "marks": 3,
-                        "solution": "96 = 2^5 × 3, 404 = 2^2 × 101...",
-                        "topics": ["Prime Factorization", "HCF"]
-                    }
-                ],
-                "Polynomials": [
-                    {
-                        "question": "If α and β are the zeroes of the polynomial x² - 5x + 6, find α² + β².",
-                        "type": "short_answer",
-                        "difficulty": "medium",
-                        "marks": 3,
-                        "solution": "Using α + β = 5, αβ = 6...",
-                        "topics": ["Zeroes of Polynomial", "Relationships"]
-                    }
-                ]
-            }
-        }
+    # Public accessors return plain dict/list copies; the shared frozen data stays internal
+    
+    @property
+    def syllabus_data(self) -> Dict[str, Any]:
+        """Comprehensive syllabus data for different boards"""
+        self._ensure_loaded()
+        return _thaw(SyllabusAnalyzer._SYLLABUS)
+    
+    @property
+    def topic_difficulty_mapping(self) -> Dict[str, Dict[str, Any]]:
+        """Difficulty mapping for topics and question types"""
+        self._ensure_loaded()
+        return _thaw(SyllabusAnalyzer._DIFFICULTY)
+    
+    @property
+    def question_bank(self) -> Dict[str, Any]:
+        """Question bank templates for different topics"""
+        self._ensure_loaded()
+        return _thaw(SyllabusAnalyzer._QUESTION_BANK)
     
     def get_syllabus(self, board: str, class_level: str, subject: str) -> Dict[str, Any]:
         """Get syllabus for specific board, class, and subject"""
+        return _thaw(self._syllabus(board, class_level, subject))
+    
+    def _syllabus(self, board: str, class_level: str, subject: str) -> Mapping[str, Any]:
+        """Shared read-only syllabus, logging lookup failures"""
         try:
-            syllabus = self.syllabus_data.get(board, {}).get(class_level, {}).get(subject, {})
-            if not syllabus:
-                raise ValueError(f"Syllabus not found for {board} {class_level} {subject}")
-            return syllabus
+            return _get_syllabus_cached(board, class_level, subject)
         except Exception as e:
             logger.error(f"Error getting syllabus: {str(e)}")
             raise
@@ -362,58 +114,24 @@ class SyllabusAnalyzer:
     def select_topics(self, board: str, class_level: str, subject: str, 
                      total_marks: int, topic_preferences: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Intelligently select topics based on weightage and preferences"""
-        syllabus = self.get_syllabus(board, class_level, subject)
-        units = syllabus.get("units", [])
-        
-        # If specific topics are preferred, prioritize them
-        if topic_preferences:
-            selected_units = [unit for unit in units if unit["name"] in topic_preferences]
-        else:
-            selected_units = units
-        
-        # Calculate topic distribution based on weightage
-        total_weightage = sum(unit["weightage"] for unit in selected_units)
-        topic_distribution = []
+        self._syllabus(board, class_level, subject)
         
-        for unit in selected_units:
-            marks_allocation = int((unit["weightage"] / total_weightage) * total_marks)
-            topic_distribution.append({
-                "unit_name": unit["name"],
-                "topics": unit["topics"],
-                "allocated_marks": marks_allocation,
-                "difficulty": unit["difficulty"],
-                "question_types": unit.get("question_types", ["mcq", "short_answer", "long_answer"])
-            })
-        
-        return topic_distribution
+        # Hashable, order-free preference set so results can be memoized
+        prefs = frozenset(topic_preferences) if topic_preferences else None
+        return _thaw(_select_topics_cached(board, class_level, subject, total_marks, prefs))
     
     def get_question_distribution(self, board: str, class_level: str, subject: str,
                                 total_marks: int, difficulty_distribution: Dict[str, float]) -> Dict[str, Any]:
         """Get question distribution based on paper pattern and difficulty"""
-        syllabus = self.get_syllabus(board, class_level, subject)
-        paper_pattern = syllabus.get("paper_pattern", {})
-        
-        question_distribution = {}
-        remaining_marks = total_marks
-        
-        for section, config in paper_pattern.items():
-            section_marks = config["questions"] * config["marks_per_question"]
-            if section_marks <= remaining_marks:
-                question_distribution[section] = {
-                    "type": config["type"],
-                    "questions": config["questions"],
-                    "marks_per_question": config["marks_per_question"],
-                    "total_marks": section_marks,
-                    "difficulty_distribution": difficulty_distribution
-                }
-                remaining_marks -= section_marks
-        
-        return question_distribution
+        self._syllabus(board, class_level, subject)
+        return _thaw(_get_question_distribution_cached(
+            board, class_level, subject, total_marks, tuple(sorted(difficulty_distribution.items()))
+        ))
     
     def validate_paper_requirements(self, board: str, class_level: str, subject: str,
                                   total_marks: int, duration: str) -> Dict[str, Any]:
         """Validate if paper requirements are feasible"""
-        syllabus = self.get_syllabus(board, class_level, subject)
+        syllabus = self._syllabus(board, class_level, subject)
         
         validation_result = {
             "is_valid": True,
@@ -441,12 +159,13 @@ class SyllabusAnalyzer:
     def get_learning_objectives(self, board: str, class_level: str, subject: str, 
                               topics: List[str]) -> List[str]:
         """Get learning objectives for selected topics"""
-        syllabus = self.get_syllabus(board, class_level, subject)
-        units = syllabus.get("units", [])
+        syllabus = self._syllabus(board, class_level, subject)
+        selected = frozenset(topics)
         
+        # Syllabus order, with a set lookup per unit
         objectives = []
-        for unit in units:
-            if unit["name"] in topics:
+        for unit in syllabus.get("units", []):
+            if unit["name"] in selected:
                 for topic in unit["topics"]:
                     objectives.append(f"Understand and apply concepts of {topic}")
         
@@ -455,7 +174,104 @@ class SyllabusAnalyzer:
     def generate_paper_instructions(self, board: str, class_level: str, subject: str,
                                   total_marks: int, duration: str) -> str:
         """Generate paper instructions based on board and subject"""
-        instructions = f"""
+        return _paper_instructions(board, class_level, subject, total_marks, duration)
+
+@lru_cache(maxsize=128)
+def _get_syllabus_cached(board: str, class_level: str, subject: str) -> Mapping[str, Any]:
+    """Syllabus lookup shared by all analyzers; repeat lookups during a paper build are a single hash hit"""
+    SyllabusAnalyzer._ensure_loaded()
+    syllabus = SyllabusAnalyzer._SYLLABUS.get(board, {}).get(class_level, {}).get(subject, {})
+    if not syllabus:
+        raise ValueError(f"Syllabus not found for {board} {class_level} {subject}")
+    return syllabus
+
+class UnitColumns(NamedTuple):
+    """Columnar view of a syllabus's units, aligned with its "units" list"""
+    names: np.ndarray
+    weightages: np.ndarray
+
+@lru_cache(maxsize=128)
+def _get_unit_columns(board: str, class_level: str, subject: str) -> UnitColumns:
+    """Unit names and weightages of a syllabus as parallel arrays for vectorized selection"""
+    units = _get_syllabus_cached(board, class_level, subject).get("units", [])
+    return UnitColumns(
+        names=np.array([unit["name"] for unit in units], dtype=str),
+        weightages=np.array([unit["weightage"] for unit in units], dtype=np.int32)
+    )
+
+class PatternRow(NamedTuple):
+    """One paper-pattern section with its marks precomputed"""
+    section: str
+    type: str
+    questions: int
+    marks_per_question: int
+    total_marks: int
+
+@lru_cache(maxsize=128)
+def _get_pattern_rows(board: str, class_level: str, subject: str) -> Tuple[PatternRow, ...]:
+    """Paper-pattern sections of a syllabus as flat rows, in pattern order"""
+    paper_pattern = _get_syllabus_cached(board, class_level, subject).get("paper_pattern", {})
+    return tuple(
+        PatternRow(section, config["type"], config["questions"], config["marks_per_question"],
+                   config["questions"] * config["marks_per_question"])
+        for section, config in paper_pattern.items()
+    )
+
+@lru_cache(maxsize=256)
+def _select_topics_cached(board: str, class_level: str, subject: str, total_marks: int,
+                          prefs: Optional[FrozenSet[str]]) -> Tuple[Mapping[str, Any], ...]:
+    """Topic distribution for a paper, as read-only mappings shared between callers"""
+    units = _get_syllabus_cached(board, class_level, subject).get("units", [])
+    columns = _get_unit_columns(board, class_level, subject)
+    
+    # If specific topics are preferred, prioritize them
+    if prefs:
+        selected = np.flatnonzero(np.isin(columns.names, list(prefs)))
+    else:
+        selected = np.arange(len(units))
+    
+    # Calculate topic distribution based on weightage, all units in one integer vector op
+    weightage = columns.weightages[selected].astype(np.int64)
+    marks_allocations = (weightage * total_marks // max(int(weightage.sum()), 1)).tolist()
+    topic_distribution = []
+    
+    for unit, marks_allocation in zip((units[i] for i in selected), marks_allocations):
+        topic_distribution.append(MappingProxyType({
+            "unit_name": unit["name"],
+            "topics": unit["topics"],
+            "allocated_marks": marks_allocation,
+            "difficulty": unit["difficulty"],
+            "question_types": unit.get("question_types", QUESTION_TYPES_ALL)
+        }))
+    
+    return tuple(topic_distribution)
+
+@lru_cache(maxsize=256)
+def _get_question_distribution_cached(board: str, class_level: str, subject: str, total_marks: int,
+                                      difficulty_items: Tuple[Tuple[str, float], ...]) -> Mapping[str, Any]:
+    """Question distribution for a paper, as a read-only mapping shared between callers"""
+    difficulty_distribution = MappingProxyType(dict(difficulty_items))
+    
+    question_distribution = {}
+    remaining_marks = total_marks
+    
+    for section, question_type, questions, marks_per_question, section_marks in _get_pattern_rows(board, class_level, subject):
+        if section_marks <= remaining_marks:
+            question_distribution[section] = MappingProxyType({
+                "type": question_type,
+                "questions": questions,
+                "marks_per_question": marks_per_question,
+                "total_marks": section_marks,
+                "difficulty_distribution": difficulty_distribution
+            })
+            remaining_marks -= section_marks
+    
+    return MappingProxyType(question_distribution)
+
+@lru_cache(maxsize=128)
+def _paper_instructions(board: str, class_level: str, subject: str, total_marks: int, duration: str) -> str:
+    """Paper instructions text, formatted once per distinct paper header"""
+    instructions = f"""
         {board} {class_level} {subject} Examination
         Total Marks: {total_marks}
         Duration: {duration}
@@ -467,12 +283,22 @@ class SyllabusAnalyzer:
         4. Draw neat diagrams wherever required.
         5. Write your answers clearly and legibly.
         """
-        
-        return instructions.strip()
+    
+    return instructions.strip()
+
+_default: Optional[SyllabusAnalyzer] = None
+
+def get_analyzer() -> SyllabusAnalyzer:
+    """Process-wide analyzer shared by all request handlers"""
+    global _default
+    if _default is None:
+        _default = SyllabusAnalyzer()
+        _default._ensure_loaded()
+    return _default
 
 # Example usage
 if __name__ == "__main__":
-    analyzer = SyllabusAnalyzer()
+    analyzer = get_analyzer()
     
     # Get syllabus for CBSE Class 10 Mathematics
     syllabus = analyzer.get_syllabus("CBSE", "class_10", "Mathematics")
@@ -487,4 +313,4 @@ if __name__ == "__main__":
         "CBSE", "class_10", "Mathematics", 80,
         {"easy": 0.3, "medium": 0.5, "hard": 0.2}
     )
-    print(f"Question distribution: {distribution}") 
\ No newline at end of file
+    print(f"Question distribution: {distribution}")
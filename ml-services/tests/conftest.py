@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Import application modules the way the API does, with src/ on the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,69 @@
+import pytest
+
+from utils.batcher import MicroBatcher
+
+def _submit_concurrently(batcher, items):
+    """Queue all items before the batching thread starts so they form one batch"""
+    futures = [batcher.submit(item) for item in items]
+    batcher.start()
+    return futures
+
+def test_results_are_paired_with_their_items():
+    batches = []
+
+    def double(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(double, max_batch_size=8)
+    futures = _submit_concurrently(batcher, [1, 2, 3])
+    try:
+        assert [future.result(timeout=5) for future in futures] == [2, 4, 6]
+        assert batches == [[1, 2, 3]]
+    finally:
+        batcher.stop()
+
+def test_batches_are_capped_at_max_batch_size():
+    sizes = []
+
+    def record(items):
+        sizes.append(len(items))
+        return list(items)
+
+    batcher = MicroBatcher(record, max_batch_size=2)
+    futures = _submit_concurrently(batcher, list(range(5)))
+    try:
+        assert [future.result(timeout=5) for future in futures] == list(range(5))
+        assert sizes == [2, 2, 1]
+    finally:
+        batcher.stop()
+
+def test_short_result_list_fails_every_future():
+    batcher = MicroBatcher(lambda items: items[:1], max_batch_size=8)
+    futures = _submit_concurrently(batcher, ["a", "b", "c"])
+    try:
+        for future in futures:
+            with pytest.raises(RuntimeError, match="1 results for a batch of 3"):
+                future.result(timeout=5)
+    finally:
+        batcher.stop()
+
+def test_batch_fn_error_fails_every_future():
+    def fail(items):
+        raise ValueError("model unavailable")
+
+    batcher = MicroBatcher(fail, max_batch_size=8)
+    futures = _submit_concurrently(batcher, [1, 2])
+    try:
+        for future in futures:
+            with pytest.raises(ValueError, match="model unavailable"):
+                future.result(timeout=5)
+    finally:
+        batcher.stop()
+
+def test_stop_flushes_queued_items():
+    batcher = MicroBatcher(lambda items: list(items), max_batch_size=8)
+    batcher.start()
+    futures = [batcher.submit(item) for item in range(3)]
+    batcher.stop()
+    assert [future.result(timeout=0) for future in futures] == [0, 1, 2]
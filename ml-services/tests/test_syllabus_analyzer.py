@@ -0,0 +1,34 @@
+import json
+
+from utils.syllabus_analyzer import SyllabusAnalyzer
+
+BOARD, CLASS_LEVEL, SUBJECT = "CBSE", "class_10", "Mathematics"
+DIFFICULTY = {"easy": 0.3, "medium": 0.5, "hard": 0.2}
+
+def test_public_results_are_plain_json_serializable_copies():
+    analyzer = SyllabusAnalyzer()
+    results = [
+        analyzer.get_syllabus(BOARD, CLASS_LEVEL, SUBJECT),
+        analyzer.select_topics(BOARD, CLASS_LEVEL, SUBJECT, 80),
+        analyzer.get_question_distribution(BOARD, CLASS_LEVEL, SUBJECT, 80, DIFFICULTY),
+        analyzer.syllabus_data,
+        analyzer.topic_difficulty_mapping,
+        analyzer.question_bank
+    ]
+    json.dumps(results)
+
+    # Callers own their copies; mutating one must not leak into the shared cache
+    results[0]["units"].clear()
+    results[1][0]["topics"].append("extra")
+    assert analyzer.get_syllabus(BOARD, CLASS_LEVEL, SUBJECT)["units"]
+    assert "extra" not in analyzer.select_topics(BOARD, CLASS_LEVEL, SUBJECT, 80)[0]["topics"]
+
+def test_learning_objectives_follow_syllabus_order():
+    analyzer = SyllabusAnalyzer()
+    units = analyzer.get_syllabus(BOARD, CLASS_LEVEL, SUBJECT)["units"]
+    names = [unit["name"] for unit in units]
+
+    objectives = analyzer.get_learning_objectives(BOARD, CLASS_LEVEL, SUBJECT, names[::-1] + ["Unknown"])
+    assert objectives == [
+        f"Understand and apply concepts of {topic}" for unit in units for topic in unit["topics"]
+    ]
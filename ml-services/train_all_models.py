@@ -20,7 +20,7 @@ def train_attendance_model():
     logger.info("Training Attendance Anomaly Detection Model...")
     
     try:
-        from utils.train_attendance_model import train_performance_model as train_attendance
+        from utils.train_attendance_model import train_attendance_model as train_attendance
         model = train_attendance()
         logger.info("✅ Attendance model trained successfully")
         return True
@@ -62,7 +62,7 @@ def main():
     models_dir = Path("src/models")
     models_dir.mkdir(exist_ok=True)
     
-    # Train all models
+    # Train all models one after another so parallel fits (n_jobs=-1) have every core to themselves
     results = {
         "attendance": train_attendance_model(),
         "performance": train_performance_model(),